@@ -1,6 +1,21 @@
-from .core import HookSystem
+from .core import (
+    HookSystem,
+    invoke,
+    invoke_many,
+    invoke_aggregate,
+    get_hook_implementations,
+)
 from .decorators import register_hook, hook
 from .registry import hook_registry
 
 __version__ = "1.0.0"
-__all__ = ["HookSystem", "register_hook", "hook", "hook_registry"]
+__all__ = [
+    "HookSystem",
+    "invoke",
+    "invoke_many",
+    "invoke_aggregate",
+    "get_hook_implementations",
+    "register_hook",
+    "hook",
+    "hook_registry",
+]
@@ -1,92 +1,183 @@
-from typing import Any, Callable, List, Optional, Tuple
-from .registry import hook_registry
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from .registry import _app_of, hook_registry
+
+__all__ = [
+    "HookSystem",
+    "invoke",
+    "invoke_many",
+    "invoke_aggregate",
+    "get_hook_implementations",
+    "register_hook",
+]
+
+_logger = logging.getLogger(__name__)
+# Default for ``sender`` so that an explicit None is still passed on
+_NO_SENDER: Any = object()
+# Formatted lazily by logging, only when a handler emits the record
+_ERROR_MESSAGE = "Error executing hook %s in app %s: %s"
+
+
+def invoke(
+    hook_name: str, *args: Any, sender: Any = _NO_SENDER, **kwargs: Any
+) -> List[Any]:
+    """
+    Invoke a hook and aggregate results from all implementers
+
+    Args:
+        hook_name: Name of the hook
+        *args: Positional arguments
+        sender: Only run implementers registered without a sender or for
+            an equal (``==``) sender, and pass it on to them as the
+            ``sender`` keyword. If omitted, sender-bound implementers are
+            skipped (they are still listed by ``get_hook_implementations``)
+        **kwargs: Keyword arguments
+
+    Returns:
+        List of results, in registration order
+    """
 
+    if sender is _NO_SENDER:
+        hooks = hook_registry.get_receivers(hook_name, None)
+    else:
+        hooks = hook_registry.get_receivers(hook_name, sender)
+        kwargs["sender"] = sender
+    if not hooks:
+        return []
+
+    if len(hooks) == 1:
+        # Most hooks have a single implementer; skip the accumulator loop
+        ((app_name, hook_func),) = hooks
+        try:
+            return [hook_func(*args, **kwargs)]
+        except Exception as e:
+            _logger.error(_ERROR_MESSAGE, hook_name, app_name, e)
+            return []
+
+    results: List[Any] = []
+    append = results.append
+
+    for app_name, hook_func in hooks:
+        try:
+            append(hook_func(*args, **kwargs))
+        except Exception as e:
+            _logger.error(_ERROR_MESSAGE, hook_name, app_name, e)
+
+    return results
+
+
+def invoke_many(
+    hook_names: Sequence[str],
+    *args: Any,
+    sender: Any = _NO_SENDER,
+    **kwargs: Any,
+) -> Dict[str, List[Any]]:
+    """
+    Invoke several hooks in order with the same arguments
 
-class HookSystem:
+    Args:
+        hook_names: Names of the hooks, in invocation order
+        *args: Positional arguments
+        sender: Filters and is passed on as for ``invoke``
+        **kwargs: Keyword arguments
+
+    Raises:
+        TypeError: If ``hook_names`` is a single string
+
+    Returns:
+        Dict of {hook_name: list of results}; a hook listed more than once
+        runs each time and collects all of its results in one list
     """
-    Hook management system for Django
+    if isinstance(hook_names, str):
+        raise TypeError("hook_names must be a sequence of hook names, not a str")
+
+    get_receivers = hook_registry.get_receivers
+    if sender is _NO_SENDER:
+        sender = None
+    else:
+        kwargs["sender"] = sender
+
+    out: Dict[str, List[Any]] = {}
+    for hook_name in hook_names:
+        # A name listed twice runs twice; its results share one list
+        results = out.setdefault(hook_name, [])
+        append = results.append
+        for app_name, hook_func in get_receivers(hook_name, sender):
+            try:
+                append(hook_func(*args, **kwargs))
+            except Exception as e:
+                _logger.error(_ERROR_MESSAGE, hook_name, app_name, e)
+
+    return out
+
+
+def invoke_aggregate(
+    hook_name: str,
+    aggregator: Callable[[List[Any]], Any],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
     """
+    Invoke hook and aggregate results with custom aggregator function
 
-    @classmethod
-    def invoke(cls, hook_name: str, *args: Any, **kwargs: Any) -> List[Any]:
-        """
-        Invoke a hook and aggregate results from all implementers
+    Args:
+        hook_name: Name of the hook
+        aggregator: Aggregator function
+        *args: Positional arguments
+        **kwargs: Keyword arguments
 
-        Args:
-            hook_name: Name of the hook
-            *args: Positional arguments
-            **kwargs: Keyword arguments
+    Returns:
+        Aggregated result
+    """
+    results = invoke(hook_name, *args, **kwargs)
+    return aggregator(results)
 
-        Returns:
-            Dict of {app_name: result}
-        """
 
-        results: List[Any] = []
+def get_hook_implementations(
+    hook_name: str,
+) -> Tuple[Tuple[str, Callable[..., Any]], ...]:
+    """
+    Get all implementers of a hook
 
-        for _, hook_func in hook_registry.get_hooks(hook_name):
-            try:
-                result = hook_func(*args, **kwargs)
-                results.append(result)
-            except Exception as e:
-                import logging
-
-                logger = logging.getLogger(__name__)
-                logger.error(f"Error executing hook {hook_name}: {e}")
-
-        return results
-
-    @classmethod
-    def invoke_aggregate(
-        cls,
-        hook_name: str,
-        aggregator: Callable[[List[Any]], Any],
-        *args: Any,
-        **kwargs: Any,
-    ) -> Any:
-        """
-        Invoke hook and aggregate results with custom aggregator function
-
-        Args:
-            hook_name: Name of the hook
-            aggregator: Aggregator function
-            *args: Positional arguments
-            **kwargs: Keyword arguments
-
-        Returns:
-            Aggregated result
-        """
-        results = cls.invoke(hook_name, *args, **kwargs)
-        return aggregator(results)
-
-    @classmethod
-    def get_hook_implementations(
-        cls, hook_name: str
-    ) -> List[Tuple[str, Callable[..., Any]]]:
-        """
-        Get all implementers of a hook
-
-        Returns:
-            List of tuples containing (app_name, hook_function)
-        """
-        return hook_registry.get_hooks(hook_name)
-
-    @classmethod
-    def register_hook(
-        cls,
-        hook_name: str,
-        hook_func: Callable[..., Any],
-        app_name: Optional[str] = None,
-    ) -> None:
-        """
-        Manually register a hook
-
-        Args:
-            hook_name: Name of the hook
-            hook_func: Hook function
-            app_name: App name (optional)
-        """
-        if app_name is None:
-            # Use module name if app name not provided
-            app_name = hook_func.__module__.split(".")[0]
-
-        hook_registry.register(hook_name, hook_func, app_name)
+    Returns:
+        Tuple of tuples containing (app_name, hook_function)
+    """
+    return hook_registry.get_hooks(hook_name)
+
+
+def register_hook(
+    hook_name: str,
+    hook_func: Callable[..., Any],
+    app_name: Optional[str] = None,
+    sender: Optional[Any] = None,
+) -> None:
+    """
+    Manually register a hook
+
+    Args:
+        hook_name: Name of the hook
+        hook_func: Hook function
+        app_name: App name (optional)
+        sender: Only run for invocations with an equal sender (optional);
+            must be hashable
+    """
+    if app_name is None:
+        # Use module name if app name not provided
+        app_name = _app_of(hook_func.__module__)
+
+    hook_registry.register(hook_name, hook_func, app_name, sender)
+
+
+class HookSystem:
+    """
+    Hook management system for Django
+
+    Thin namespace over the module-level functions, kept for backward
+    compatibility.
+    """
+
+    invoke = staticmethod(invoke)
+    invoke_many = staticmethod(invoke_many)
+    invoke_aggregate = staticmethod(invoke_aggregate)
+    get_hook_implementations = staticmethod(get_hook_implementations)
+    register_hook = staticmethod(register_hook)
@@ -1,9 +1,10 @@
 from typing import Callable, Optional, Any
-from .registry import hook_registry
+from .registry import _app_of, hook_registry
 
 
 def hook(
     hook_name: Optional[str] = None,
+    sender: Optional[Any] = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator for registering functions as django_hook
@@ -12,6 +13,10 @@ def hook(
         @hook('my_custom_hook')
         def my_hook_function(arg1, arg2):
             return something
+
+        @hook('pre_save', sender=Article)
+        def article_pre_save(instance, sender):
+            return something
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -20,16 +25,16 @@ def hook(
             hook_name = func.__name__
 
         # Extract app name from function module
-        app_name = func.__module__.split(".")[0]
+        app_name = _app_of(func.__module__)
 
-        hook_registry.register(hook_name, func, app_name)
+        hook_registry.register(hook_name, func, app_name, sender)
         return func
 
     return decorator
 
 
 def register_hook(
-    hook_name: str, app_name: Optional[str] = None
+    hook_name: str, app_name: Optional[str] = None, sender: Optional[Any] = None
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Helper function for manual hook registration
@@ -38,9 +43,9 @@ def register_hook(
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         nonlocal app_name
         if app_name is None:
-            app_name = func.__module__.split(".")[0]
+            app_name = _app_of(func.__module__)
 
-        hook_registry.register(hook_name, func, app_name)
+        hook_registry.register(hook_name, func, app_name, sender)
         return func
 
     return decorator
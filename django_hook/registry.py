@@ -1,16 +1,57 @@
-from typing import Callable, Dict, List, Tuple, Any
+import sys
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Set, Tuple, Any
+
+# Cache of module path -> top-level package name
+_module_root_cache: Dict[str, str] = {}
+
+
+def _app_of(module: str) -> str:
+    """Return the app name (top-level package) for a module path"""
+    root = _module_root_cache.get(module)
+    if root is None:
+        root = _module_root_cache[module] = module.partition(".")[0]
+    return root
 
 
 class HookRegistry:
     """
     Registry for storing and managing django_hook
+
+    Uses ``__slots__``; subclasses that need extra state must declare their
+    own ``__slots__`` (or omit it to get a ``__dict__``).
     """
 
+    __slots__ = (
+        "_hooks",
+        "_readonly",
+        "_frozen",
+        "_seen",
+        "_senders",
+        "_by_sender",
+    )
+
     def __init__(self) -> None:
         self._hooks: Dict[str, List[Tuple[str, Callable[..., Any]]]] = {}
+        # Live read-only view of ``_hooks`` handed out by ``get_all_hooks``
+        self._readonly = MappingProxyType(self._hooks)
+        # Immutable snapshots of ``_hooks`` handed out by ``get_hooks``
+        self._frozen: Dict[str, Tuple[Tuple[str, Callable[..., Any]], ...]] = {}
+        # (app_name, hook_func, sender) keys already registered
+        self._seen: Dict[str, Set[Tuple[str, Callable[..., Any], Any]]] = {}
+        # Sender of each registration, parallel to ``_hooks``
+        self._senders: Dict[str, List[Any]] = {}
+        # Per hook name: sender -> receivers applicable to that sender
+        self._by_sender: Dict[
+            str, Dict[Any, Tuple[Tuple[str, Callable[..., Any]], ...]]
+        ] = {}
 
     def register(
-        self, hook_name: str, hook_func: Callable[..., Any], app_name: str
+        self,
+        hook_name: str,
+        hook_func: Callable[..., Any],
+        app_name: str,
+        sender: Optional[Any] = None,
     ) -> None:
         """
         Register a new hook
@@ -19,38 +60,118 @@ class HookRegistry:
             hook_name: Name of the hook
             hook_func: Hook function
             app_name: Application name
+            sender: Only run for invocations with an equal sender (optional);
+                must be hashable
         """
-        if hook_name not in self._hooks:
-            self._hooks[hook_name] = []
+        # Interned keys let lookups with literal hook names match by identity;
+        # sys.intern rejects str subclasses such as StrEnum members
+        if type(hook_name) is str:
+            hook_name = sys.intern(hook_name)
+
+        # Senders key the receiver index, so reject unhashable ones up front
+        hash(sender)
 
         # Check for duplicate registration
-        for existing_app, existing_func in self._hooks[hook_name]:
-            if existing_app == app_name and existing_func == hook_func:
+        key = (app_name, hook_func, sender)
+        seen = self._seen.setdefault(hook_name, set())
+        try:
+            if key in seen:
                 return
+            seen.add(key)
+        except TypeError:
+            # Unhashable callables fall back to an equality scan
+            registrations = zip(
+                self._hooks.get(hook_name, []), self._senders.get(hook_name, [])
+            )
+            for (existing_app, existing_func), existing_sender in registrations:
+                if (
+                    existing_app == app_name
+                    and existing_func == hook_func
+                    and existing_sender == sender
+                ):
+                    return
 
-        self._hooks[hook_name].append((app_name, hook_func))
+        self._hooks.setdefault(hook_name, []).append((app_name, hook_func))
+        self._senders.setdefault(hook_name, []).append(sender)
+        self._frozen.pop(hook_name, None)
+        self._by_sender.pop(hook_name, None)
 
-    def get_hooks(self, hook_name: str) -> List[Tuple[str, Callable[..., Any]]]:
+    def get_hooks(self, hook_name: str) -> Tuple[Tuple[str, Callable[..., Any]], ...]:
         """
         Get all implementers of a hook
 
         Returns:
-            List of tuples containing (app_name, hook_function)
+            Tuple of tuples containing (app_name, hook_function)
         """
-        return self._hooks.get(hook_name, [])
+        frozen = self._frozen.get(hook_name)
+        if frozen is None:
+            hooks = self._hooks.get(hook_name)
+            if not hooks:
+                return ()
+            frozen = self._frozen[hook_name] = tuple(hooks)
+        return frozen
+
+    def get_receivers(
+        self, hook_name: str, sender: Optional[Any] = None
+    ) -> Tuple[Tuple[str, Callable[..., Any]], ...]:
+        """
+        Get the implementers of a hook that apply to a sender
+
+        Implementers registered without a sender apply to every invocation;
+        those registered for a sender only apply when invoked with an equal
+        sender.
+
+        Returns:
+            Tuple of tuples containing (app_name, hook_function)
+        """
+        index = self._by_sender.get(hook_name)
+        if index is None:
+            if hook_name not in self._hooks:
+                return ()
+            index = self._by_sender[hook_name] = self._index_senders(hook_name)
+        try:
+            receivers = index.get(sender)
+        except TypeError:
+            # Unhashable senders cannot have been registered
+            receivers = None
+        if receivers is None:
+            # Sender has no dedicated implementers
+            receivers = index[None]
+        return receivers
+
+    def _index_senders(
+        self, hook_name: str
+    ) -> Dict[Any, Tuple[Tuple[str, Callable[..., Any]], ...]]:
+        """Build the sender -> receivers index for a hook"""
+        registrations = list(zip(self._hooks[hook_name], self._senders[hook_name]))
+        index = {None: tuple(hook for hook, sender in registrations if sender is None)}
+        for bound in {s for s in self._senders[hook_name] if s is not None}:
+            index[bound] = tuple(
+                hook
+                for hook, sender in registrations
+                if sender is None or sender == bound
+            )
+        return index
 
-    def get_all_hooks(self) -> Dict[str, List[Tuple[str, Callable[..., Any]]]]:
+    def get_all_hooks(self) -> Mapping[str, List[Tuple[str, Callable[..., Any]]]]:
         """
         Get all registered django_hook
 
         Returns:
-            Dictionary of all django_hook
+            Read-only live view of all django_hook; it reflects later
+            registrations, so copy it if a snapshot is needed. The lists
+            are the registry's own storage and must not be mutated; use
+            ``register`` instead, or the registry's caches go stale
         """
-        return self._hooks.copy()
+        return self._readonly
 
     def clear(self) -> None:
         """Clear all django_hook"""
         self._hooks.clear()
+        self._frozen.clear()
+        self._seen.clear()
+        self._senders.clear()
+        self._by_sender.clear()
 
 
 # Global registry instance
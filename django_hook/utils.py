@@ -1,35 +1,122 @@
+import sys
+from itertools import chain
 from typing import Any, List, Dict, Optional
 
+# Dtypes the numba kernel can compile; others (float16, longdouble) use sum()
+_NUMBA_DTYPES = frozenset(
+    [
+        "int8",
+        "int16",
+        "int32",
+        "int64",
+        "uint8",
+        "uint16",
+        "uint32",
+        "uint64",
+        "float32",
+        "float64",
+    ]
+)
+
+# Compiled kernel, loaded on the first eligible call; False if numba is missing
+_sum_rows: Any = None
+
+
+def _load_sum_rows() -> Any:
+    """Import numba and compile the row-summing kernel on first use"""
+    global _sum_rows
+    try:
+        from numba import njit, prange
+    except ImportError:
+        _sum_rows = False
+        return _sum_rows
+
+    @njit(parallel=True, cache=True)
+    def sum_rows(stacked: Any) -> Any:  # pragma: no cover - compiled by numba
+        rows, cols = stacked.shape
+        out = stacked[0].copy()
+        for col in prange(cols):
+            total = out[col]
+            for row in range(1, rows):
+                total += stacked[row, col]
+            out[col] = total
+        return out
+
+    _sum_rows = sum_rows
+    return _sum_rows
+
+
+def _sum_arrays(results: List[Any]) -> Any:
+    """
+    Sum same-shaped numeric numpy arrays with the numba kernel
+
+    Returns:
+        The summed array, or None if the results are not eligible
+    """
+    # Results can only be arrays if something already imported numpy
+    np = sys.modules.get("numpy")
+    if np is None:
+        return None
+    first = results[0]
+    if (
+        type(first) is not np.ndarray
+        or first.dtype.name not in _NUMBA_DTYPES
+        or not first.dtype.isnative
+    ):
+        return None
+    shape, dtype = first.shape, first.dtype
+    for result in results:
+        if (
+            type(result) is not np.ndarray
+            or result.shape != shape
+            or result.dtype != dtype
+        ):
+            return None
+
+    kernel = _sum_rows if _sum_rows is not None else _load_sum_rows()
+    if kernel is False:
+        return None
+    stacked = np.stack(results).reshape(len(results), -1)
+    return kernel(stacked).reshape(shape)
+
 
 def aggregate_sum(results: List[Any]) -> Any:
-    """Sum aggregator"""
+    """
+    Sum aggregator
+
+    Same-shaped numpy arrays of a numba-supported dtype are summed with a
+    numba kernel when numba is installed (``pip install django-hook[numba]``).
+    """
+    if len(results) > 1:
+        summed = _sum_arrays(results)
+        if summed is not None:
+            return summed
     return sum(results)
 
 
 def aggregate_list(results: List[Any]) -> List[Any]:
     """List aggregator (flatten list)"""
-    return [
-        item
-        for sublist in results
-        for item in (sublist if isinstance(sublist, list) else [sublist])
-    ]
+    return list(
+        chain.from_iterable(
+            result if type(result) is list or isinstance(result, list) else (result,)
+            for result in results
+        )
+    )
 
 
 def aggregate_dict(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Dictionary aggregator (merge dictionaries)"""
     aggregated: Dict[str, Any] = {}
+    update = aggregated.update
     for result in results:
-        if isinstance(result, dict):
-            aggregated.update(result)
+        if type(result) is dict or isinstance(result, dict):
+            update(result)
     return aggregated
 
 
 def aggregate_first_non_none(results: List[Any]) -> Optional[Any]:
     """First non-None value aggregator"""
-    for result in results:
-        if result is not None:
-            return result
-    return None
+    return next((result for result in results if result is not None), None)
 
 
 def aggregate_all(results: List[Any]) -> List[Any]:
@@ -29,12 +29,18 @@ def reset_hook_registry():
     from django_hook.registry import hook_registry
 
     # Store original state
-    original_hooks = hook_registry._hooks.copy()
+    original_hooks = {
+        hook_name: list(zip(hooks, hook_registry._senders[hook_name]))
+        for hook_name, hooks in hook_registry.get_all_hooks().items()
+    }
 
     # Clear for test
     hook_registry.clear()
 
     yield
 
-    # Restore original state
-    hook_registry._hooks = original_hooks
+    # Restore original state through the public API so caches stay consistent
+    hook_registry.clear()
+    for hook_name, hooks in original_hooks.items():
+        for (app_name, hook_func), sender in hooks:
+            hook_registry.register(hook_name, hook_func, app_name, sender)
@@ -1,12 +1,19 @@
+import logging
 import os
+import subprocess
+import sys
 import tempfile
+import unittest
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from enum import StrEnum
 
 import pytest
 from django.test import TestCase
 from unittest.mock import patch, MagicMock
 
 # Import the hook system components
-from django_hook.core import HookSystem
+from django_hook.core import HookSystem, invoke
 from django_hook.registry import HookRegistry, hook_registry
 from django_hook.decorators import hook, register_hook
 from django_hook.utils import (
@@ -17,6 +24,16 @@ from django_hook.utils import (
     aggregate_all,
 )
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 
 class TestHookRegistry(TestCase):
     def setUp(self):
@@ -53,11 +70,169 @@ class TestHookRegistry(TestCase):
         hooks = self.registry.get_hooks("test_hook")
         self.assertEqual(len(hooks), 1)
 
+    def test_duplicate_bound_method_registration(self):
+        """Test that registering the same bound method twice is ignored"""
+
+        class Handler:
+            def handle(self):
+                return "handled"
+
+        handler = Handler()
+        self.registry.register("test_hook", handler.handle, "test_app")
+        self.registry.register("test_hook", handler.handle, "test_app")
+
+        hooks = self.registry.get_hooks("test_hook")
+        self.assertEqual(len(hooks), 1)
+
+    def test_duplicate_unhashable_callable_registration(self):
+        """Test that unhashable callables can be registered once"""
+
+        @dataclass
+        class Handler:
+            label: str
+
+            def __call__(self):
+                return self.label
+
+        self.registry.register("test_hook", Handler("a"), "test_app")
+        self.registry.register("test_hook", Handler("a"), "test_app")
+        self.registry.register("test_hook", Handler("b"), "test_app")
+
+        hooks = self.registry.get_hooks("test_hook")
+        self.assertEqual([func() for _, func in hooks], ["a", "b"])
+
+    def test_same_function_for_different_apps(self):
+        """Test that one function can be registered by several apps"""
+
+        def mock_hook_func():
+            return "test_result"
+
+        self.registry.register("test_hook", mock_hook_func, "app1")
+        self.registry.register("test_hook", mock_hook_func, "app2")
+        self.registry.register("test_hook", mock_hook_func, "app1")
+
+        hooks = self.registry.get_hooks("test_hook")
+        self.assertEqual([app for app, _ in hooks], ["app1", "app2"])
+
+    def test_hook_names_are_interned(self):
+        """Test that registered hook names are interned"""
+
+        def mock_hook_func():
+            return "test_result"
+
+        name = "".join(["dynamic", "_hook"])
+        self.registry.register(name, mock_hook_func, "test_app")
+
+        (stored,) = self.registry.get_all_hooks()
+        self.assertIs(stored, sys.intern(name))
+
+    def test_register_with_str_enum_name(self):
+        """Test that str subclasses such as StrEnum work as hook names"""
+
+        class Hooks(StrEnum):
+            PRE_SAVE = "pre_save"
+
+        def mock_hook_func():
+            return "test_result"
+
+        self.registry.register(Hooks.PRE_SAVE, mock_hook_func, "test_app")
+
+        self.assertEqual(len(self.registry.get_hooks(Hooks.PRE_SAVE)), 1)
+        self.assertEqual(len(self.registry.get_hooks("pre_save")), 1)
+
     def test_get_nonexistent_hook(self):
         """Test retrieving a hook that doesn't exist"""
         hooks = self.registry.get_hooks("nonexistent_hook")
         self.assertEqual(len(hooks), 0)
 
+    def test_get_hooks_reflects_new_registrations(self):
+        """Test that cached hook tuples are refreshed after registration"""
+
+        def hook1():
+            return 1
+
+        def hook2():
+            return 2
+
+        self.registry.register("test_hook", hook1, "app1")
+        first = self.registry.get_hooks("test_hook")
+        self.assertIsInstance(first, tuple)
+        self.assertIs(self.registry.get_hooks("test_hook"), first)
+
+        self.registry.register("test_hook", hook2, "app2")
+        hooks = self.registry.get_hooks("test_hook")
+        self.assertEqual(hooks, (("app1", hook1), ("app2", hook2)))
+
+    def test_get_receivers_by_sender(self):
+        """Test that sender-bound implementers only apply to their sender"""
+
+        class SenderA:
+            pass
+
+        class SenderB:
+            pass
+
+        def any_hook():
+            return "any"
+
+        def a_hook():
+            return "a"
+
+        self.registry.register("test_hook", a_hook, "app1", sender=SenderA)
+        self.registry.register("test_hook", any_hook, "app2")
+
+        self.assertEqual(
+            self.registry.get_receivers("test_hook"), (("app2", any_hook),)
+        )
+        self.assertEqual(
+            self.registry.get_receivers("test_hook", SenderA),
+            (("app1", a_hook), ("app2", any_hook)),
+        )
+        self.assertEqual(
+            self.registry.get_receivers("test_hook", SenderB), (("app2", any_hook),)
+        )
+        self.assertEqual(self.registry.get_receivers("nonexistent_hook", SenderA), ())
+        # Introspection still lists every implementer
+        self.assertEqual(len(self.registry.get_hooks("test_hook")), 2)
+
+    def test_senders_match_by_equality(self):
+        """Test that equal senders match even if they are distinct objects"""
+
+        def tenant_hook():
+            return "tenant"
+
+        self.registry.register("test_hook", tenant_hook, "app1", sender="tenant-a")
+        built = "".join(["tenant", "-a"])
+        self.registry.register("test_hook", tenant_hook, "app1", sender=built)
+
+        self.assertEqual(len(self.registry.get_hooks("test_hook")), 1)
+        self.assertEqual(
+            self.registry.get_receivers("test_hook", built), (("app1", tenant_hook),)
+        )
+        # Unhashable senders cannot be registered and match nothing bound
+        self.assertEqual(self.registry.get_receivers("test_hook", ["tenant-a"]), ())
+        with self.assertRaises(TypeError):
+            self.registry.register("test_hook", tenant_hook, "app1", sender=[1])
+
+    def test_get_all_hooks_is_read_only_view(self):
+        """Test that get_all_hooks returns a live read-only mapping"""
+
+        def mock_hook_func():
+            return "test_result"
+
+        all_hooks = self.registry.get_all_hooks()
+        self.registry.register("test_hook", mock_hook_func, "test_app")
+
+        self.assertEqual(all_hooks["test_hook"], [("test_app", mock_hook_func)])
+        with self.assertRaises(TypeError):
+            all_hooks["other_hook"] = []
+
+    def test_registry_has_no_instance_dict(self):
+        """Test that the registry uses slots instead of a __dict__"""
+        self.assertFalse(hasattr(self.registry, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.registry.unexpected = True
+
     def test_clear_registry(self):
         """Test clearing the registry"""
 
@@ -96,6 +271,16 @@ class TestHookDecorators(TestCase):
         self.assertEqual(len(hooks), 1)
         self.assertEqual(hooks[0][1], test_function)
 
+    def test_hook_decorator_app_name_from_module(self):
+        """Test @hook derives the app name from the function's module"""
+
+        @hook("module_hook")
+        def test_function():
+            return "decorated"
+
+        hooks = hook_registry.get_hooks("module_hook")
+        self.assertEqual(hooks[0][0], __name__.partition(".")[0])
+
     def test_register_hook_decorator(self):
         """Test @register_hook decorator"""
 
@@ -131,6 +316,19 @@ class TestHookSystem(TestCase):
         results = HookSystem.invoke("test_hook", "value")
         self.assertEqual(results, ["processed_value"])
 
+    def test_module_level_invoke(self):
+        """Test that the module-level invoke matches HookSystem.invoke"""
+
+        def test_hook(arg1):
+            return f"processed_{arg1}"
+
+        hook_registry.register("test_hook", test_hook, "test_app")
+
+        self.assertEqual(invoke("test_hook", "value"), ["processed_value"])
+        self.assertEqual(
+            invoke("test_hook", "value"), HookSystem.invoke("test_hook", "value")
+        )
+
     def test_invoke_multiple_hooks(self):
         """Test invoking multiple hook implementations"""
 
@@ -168,6 +366,131 @@ class TestHookSystem(TestCase):
                 any("Intentional error" in message for message in log.output)
             )
 
+    def test_invoke_single_hook_with_exception(self):
+        """Test that a failing sole implementer is logged and skipped"""
+
+        def failing_hook():
+            raise ValueError("Intentional error")
+
+        hook_registry.register("test_hook", failing_hook, "failing_app")
+
+        with self.assertLogs(level="ERROR") as log:
+            results = HookSystem.invoke("test_hook")
+            self.assertEqual(results, [])
+            self.assertTrue(any("failing_app" in message for message in log.output))
+
+    def test_invoke_with_sender(self):
+        """Test invoking a hook for a specific sender"""
+
+        class Article:
+            pass
+
+        def article_hook(sender):
+            return f"article_{sender.__name__}"
+
+        def generic_hook(**kwargs):
+            return "generic"
+
+        HookSystem.register_hook("test_hook", article_hook, "app1", sender=Article)
+        HookSystem.register_hook("test_hook", generic_hook, "app2")
+
+        self.assertEqual(HookSystem.invoke("test_hook"), ["generic"])
+        self.assertEqual(
+            HookSystem.invoke("test_hook", sender=Article),
+            ["article_Article", "generic"],
+        )
+
+    def test_invoke_with_explicit_none_sender(self):
+        """Test that an explicit sender=None is passed on to implementers"""
+
+        class Article:
+            pass
+
+        def sender_hook(sender):
+            return sender
+
+        def article_hook(sender):
+            return "article"
+
+        HookSystem.register_hook("test_hook", sender_hook, "app1")
+        HookSystem.register_hook("test_hook", article_hook, "app2", sender=Article)
+
+        self.assertEqual(HookSystem.invoke("test_hook", sender=None), [None])
+        self.assertEqual(
+            HookSystem.invoke_many(["test_hook"], sender=None), {"test_hook": [None]}
+        )
+        # Sender-bound implementers are skipped but still listed
+        self.assertEqual(len(HookSystem.get_hook_implementations("test_hook")), 2)
+
+    def test_invoke_many(self):
+        """Test invoking several hooks in one call"""
+
+        def pre_hook(arg1):
+            return f"pre_{arg1}"
+
+        def failing_hook(arg1):
+            raise ValueError("Intentional error")
+
+        def post_hook(arg1):
+            return f"post_{arg1}"
+
+        hook_registry.register("pre", pre_hook, "app1")
+        hook_registry.register("main", failing_hook, "app1")
+        hook_registry.register("post", post_hook, "app1")
+        hook_registry.register("post", pre_hook, "app1")
+
+        with self.assertLogs(level="ERROR"):
+            results = HookSystem.invoke_many(["pre", "main", "post", "none"], "v")
+        self.assertEqual(
+            results,
+            {"pre": ["pre_v"], "main": [], "post": ["post_v", "pre_v"], "none": []},
+        )
+
+    def test_invoke_error_not_formatted_when_disabled(self):
+        """Test that hook errors are not stringified if ERROR is disabled"""
+        formatted = []
+
+        class LoudError(Exception):
+            def __str__(self):
+                formatted.append(True)
+                return "loud"
+
+        def failing_hook():
+            raise LoudError()
+
+        def working_hook():
+            return "success"
+
+        hook_registry.register("test_hook", failing_hook, "failing_app")
+        hook_registry.register("test_hook", working_hook, "working_app")
+
+        logger = logging.getLogger("django_hook.core")
+        previous_level = logger.level
+        logger.setLevel(logging.CRITICAL)
+        try:
+            self.assertEqual(HookSystem.invoke("test_hook"), ["success"])
+        finally:
+            logger.setLevel(previous_level)
+        self.assertEqual(formatted, [])
+
+    def test_invoke_many_rejects_single_string(self):
+        """Test that invoke_many does not iterate a hook name by character"""
+        with self.assertRaises(TypeError):
+            HookSystem.invoke_many("pre_save")
+
+    def test_invoke_many_repeated_name(self):
+        """Test that a repeated hook name runs again and keeps all results"""
+        calls = []
+
+        def counting_hook():
+            calls.append(True)
+            return len(calls)
+
+        hook_registry.register("test_hook", counting_hook, "app1")
+
+        results = HookSystem.invoke_many(["test_hook", "other", "test_hook"])
+        self.assertEqual(results, {"test_hook": [1, 2], "other": []})
+
     def test_invoke_aggregate(self):
         """Test invoking django_hook with aggregation"""
 
@@ -215,16 +538,57 @@ class TestAggregators(TestCase):
         results = [1, 2, 3, 4]
         self.assertEqual(aggregate_sum(results), 10)
 
+    def test_aggregate_sum_does_not_import_numba(self):
+        """Test that importing the aggregators does not import numba"""
+        code = (
+            "import sys, django_hook.utils; "
+            "sys.exit('numba' in sys.modules or 'numpy' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code])
+        self.assertEqual(result.returncode, 0)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_aggregate_sum_unsupported_dtypes(self):
+        """Test sum aggregator falls back to sum() for unsupported dtypes"""
+        for dtype in (np.float16, np.longdouble, np.dtype(">f8")):
+            results = [np.ones(3, dtype=dtype), np.ones(3, dtype=dtype)]
+            np.testing.assert_array_equal(aggregate_sum(results), sum(results))
+
+    @unittest.skipIf(numba is None or np is None, "numba is not installed")
+    def test_aggregate_sum_numpy_arrays(self):
+        """Test sum aggregator with same-shaped numpy arrays"""
+        results = [np.arange(6.0).reshape(2, 3) for _ in range(3)]
+        summed = aggregate_sum(results)
+        self.assertEqual(summed.shape, (2, 3))
+        np.testing.assert_array_equal(summed, sum(results))
+
+        mixed = [np.arange(3), np.arange(3.0)]
+        np.testing.assert_array_equal(aggregate_sum(mixed), sum(mixed))
+
     def test_aggregate_list(self):
         """Test list aggregator"""
         results = [[1, 2], [3, 4], 5]
         self.assertEqual(aggregate_list(results), [1, 2, 3, 4, 5])
 
+    def test_aggregate_list_subclasses(self):
+        """Test list aggregator flattens list subclasses"""
+
+        class ResultList(list):
+            pass
+
+        results = [ResultList([1, 2]), 3]
+        self.assertEqual(aggregate_list(results), [1, 2, 3])
+
     def test_aggregate_dict(self):
         """Test dictionary aggregator"""
         results = [{"a": 1}, {"b": 2}, {"a": 3, "c": 4}]
         self.assertEqual(aggregate_dict(results), {"a": 3, "b": 2, "c": 4})
 
+    def test_aggregate_dict_subclasses(self):
+        """Test dictionary aggregator with dict subclasses"""
+        results = [OrderedDict(a=1), defaultdict(int, b=2), ["ignored"]]
+        self.assertEqual(aggregate_dict(results), {"a": 1, "b": 2})
+
     def test_aggregate_first_non_none(self):
         """Test first non-None aggregator"""
         results = [None, False, "value", "other"]
@@ -297,7 +661,7 @@ def another_hook():
     def test_hook_system_with_mock_registry(self, mock_registry):
         """Test HookSystem with a mocked registry"""
         mock_hook = MagicMock(return_value="mock_result")
-        mock_registry.get_hooks.return_value = [("test_app", mock_hook)]
+        mock_registry.get_receivers.return_value = [("test_app", mock_hook)]
 
         results = HookSystem.invoke("test_hook", "arg1", kwarg1="value1")
 
@@ -308,7 +672,7 @@ def another_hook():
         self.assertEqual(results, ["mock_result"])
 
         # Verify registry was queried
-        mock_registry.get_hooks.assert_called_once_with("test_hook")
+        mock_registry.get_receivers.assert_called_once_with("test_hook", None)
 
 
 # Test runner